@@ -1,10 +1,12 @@
 import asyncio
-import contextlib
 import json
+import shutil
+import tempfile
 from pathlib import Path
 
 import polars as pl
 import polars_st as st
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
 from loguru import logger
 
 from src.app.models import LayerConversionRequest
@@ -16,7 +18,7 @@ from src.conversion.helpers.cleaners import (
     split_cols,
     unnest_json_cols,
 )
-from src.conversion.helpers.duckdb_funcs import init_duckdb
+from src.conversion.helpers.duckdb_funcs import duckdb_connection
 from src.conversion.helpers.geojoin import fill_missing_admin_boundaries
 from src.conversion.helpers.merge import (
     _get_missing_mws_ids,
@@ -25,6 +27,7 @@ from src.conversion.helpers.merge import (
 )
 from src.conversion.helpers.scheduler import get_all_geojsons, poll_completion
 from src.utils.configs import settings
+from src.utils.event_loop import run_async
 
 COMMON_COLS = [
     "mws_id",
@@ -48,87 +51,86 @@ async def run_mws_pipeline(request: LayerConversionRequest) -> None:
         request: Configuration for the pipeline run, including layers, paths,
             and column mappings.
     """
-    import tempfile
-
     tmpdir = tempfile.mkdtemp()
     logger.info(f"Using temp directory: {tmpdir}")
 
-    logger.info(f"Fetching layer version {request.layer_version}")
-    version = await _fetch_version(request.layer_version)
-
-    logger.info("Fetching active tehsils")
-    tehsils = clean_tehsils(await get_active())
-    tehsils = merge_col_metadata(version=version, tehsils=tehsils)
-
-    logger.info("Fetching base layer")
-    base = await _fetch_base(next(iter(request.base_layer.values())))
-    base = (
-        base.with_columns(pl.lit(1.2).alias("version"))
-        .rename({"uid": "mws_id", "geom": "geometry"})
-        .with_columns(
-            st.geom("geometry").st.set_srid(4326).st.to_wkb().alias("geometry")  # type: ignore[attr-defined]
-        )
-        .collect(engine="streaming")
-        .lazy()
-    )
-
-    logger.info("Processing layers")
-    layer_results = await _process_layer(tehsils, request)
-
-    logger.info("Post-processing and materializing layers")
-    for layer in layer_results:
-        layer_results[layer] = split_cols(layer_results[layer])
-        layer_results[layer] = unnest_json_cols(layer_results[layer])
-        layer_results[layer] = prefix_cols(layer_results[layer], layer, COMMON_COLS)
-
-        layer_path = f"{tmpdir}/{layer}.parquet"
-        logger.info(f"Sinking layer '{layer}' to {layer_path}")
-        layer_results[layer].sink_parquet(layer_path, compression="zstd")
-        layer_results[layer] = pl.scan_parquet(layer_path)
-        logger.info(f"Layer '{layer}' materialized")
-
-    # Log coverage
-    missing = _get_missing_mws_ids(base, layer_results)
-    missing_df = missing.collect(engine="streaming")
-    if missing_df.height > 0:
-        logger.warning(
-            f"{missing_df.height} MWSv2 polygons are outside active tehsils — "
-            f"they will appear with null layer values. "
-            f"Sample IDs: {missing_df['mws_id'].head(5).to_list()}"
+    try:
+        logger.info(f"Fetching layer version {request.layer_version}")
+        version = await _fetch_version(request.layer_version)
+
+        logger.info("Fetching active tehsils")
+        tehsils = clean_tehsils(await get_active())
+        tehsils = merge_col_metadata(version=version, tehsils=tehsils)
+
+        logger.info("Fetching base layer")
+        base = await _fetch_base(next(iter(request.base_layer.values())))
+        base = (
+            base.with_columns(pl.lit(1.2).alias("version"))
+            .rename({"uid": "mws_id", "geom": "geometry"})
+            .with_columns(
+                st.geom("geometry").st.set_srid(4326).st.to_wkb().alias("geometry")  # type: ignore[attr-defined]
+            )
+            .collect(engine="streaming")
+            .lazy()
         )
 
-    logger.info("Merging all layers onto base")
-    merged = merge_all_layers(layer_results, base)
-
-    # Sink merged frame to temp parquet to break the join plan
-    merged_path = f"{tmpdir}/merged.parquet"
-    logger.info(f"Sinking merged frame to {merged_path}")
-    merged.with_columns(
-        st.geom("geometry").st.to_wkb().alias("geometry")  # type: ignore[attr-defined]
-    ).sink_parquet(merged_path, compression="zstd", row_group_size=100_000)
-    logger.info("Merged frame materialized")
-
-    # Reload as lazy for admin boundary fill
-    merged = pl.scan_parquet(merged_path)
-
-    # Fill admin boundaries for polygons outside active tehsils
-    if missing_df.height > 0:
-        logger.info("Adding State, District and Tehsil Data")
-        merged = fill_missing_admin_boundaries(
-            merged,
-            tehsils_path=settings.tehsil_bounds,
-        )
+        logger.info("Processing layers")
+        layer_results = await _process_layer(tehsils, request)
+
+        logger.info("Post-processing and materializing layers")
+        for layer in layer_results:
+            layer_results[layer] = split_cols(layer_results[layer])
+            layer_results[layer] = unnest_json_cols(layer_results[layer])
+            layer_results[layer] = prefix_cols(layer_results[layer], layer, COMMON_COLS)
+
+            layer_path = f"{tmpdir}/{layer}.parquet"
+            logger.info(f"Sinking layer '{layer}' to {layer_path}")
+            layer_results[layer].sink_parquet(layer_path, compression="zstd")
+            layer_results[layer] = pl.scan_parquet(layer_path)
+            logger.info(f"Layer '{layer}' materialized")
+
+        # Log coverage
+        missing_df = _get_missing_mws_ids(base, layer_results)
+        if missing_df.height > 0:
+            logger.warning(
+                f"{missing_df.height} MWSv2 polygons are outside active tehsils — "
+                f"they will appear with null layer values. "
+                f"Sample IDs: {missing_df['mws_id'].head(5).to_list()}"
+            )
 
-    logger.info(f"Writing GeoParquet to {request.output_path}")
-    await _write_geoparquet(merged, request.output_path)
+        logger.info("Merging all layers onto base")
+        merged = merge_all_layers(layer_results, base)
+
+        # Sink merged frame to temp parquet to break the join plan
+        merged_path = f"{tmpdir}/merged.parquet"
+        logger.info(f"Sinking merged frame to {merged_path}")
+        merged.with_columns(
+            st.geom("geometry").st.to_wkb().alias("geometry")  # type: ignore[attr-defined]
+        ).sink_parquet(merged_path, compression="zstd", row_group_size=100_000)
+        logger.info("Merged frame materialized")
+
+        # Reload as lazy for admin boundary fill
+        merged = pl.scan_parquet(merged_path)
+
+        # Fill admin boundaries for polygons outside active tehsils
+        if missing_df.height > 0:
+            logger.info("Adding State, District and Tehsil Data")
+            merged = fill_missing_admin_boundaries(
+                merged,
+                tehsils_path=settings.tehsil_bounds,
+            )
 
-    # Cleanup temp files
-    logger.info(f"Cleaning up temp directory: {tmpdir}")
-    import shutil
+        logger.info(f"Writing GeoParquet to {request.output_path}")
+        await _write_geoparquet(merged, request.output_path)
 
-    shutil.rmtree(tmpdir, ignore_errors=True)
-    for path in Path(settings.temp_path).glob("**/*.geojson"):
-        path.unlink()
+        # Downloaded tehsil files are kept after a failure so a rerun can
+        # reuse them instead of fetching everything again
+        for path in Path(settings.temp_path).glob("**/*.geojson"):
+            path.unlink()
+    finally:
+        # Cleanup temp files, also when a stage above raised
+        logger.info(f"Cleaning up temp directory: {tmpdir}")
+        shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 async def _write_geoparquet(merged: pl.LazyFrame, output_path: str) -> None:
@@ -161,8 +163,7 @@ async def _write_geoparquet(merged: pl.LazyFrame, output_path: str) -> None:
 
     logger.info(f"Writing {len(states)} state partitions to {output_path}")
 
-    conn = init_duckdb()
-    try:
+    with duckdb_connection() as conn:
         for state in states:
             if state is None:
                 partition_key = "unknown"
@@ -172,14 +173,16 @@ async def _write_geoparquet(merged: pl.LazyFrame, output_path: str) -> None:
                 state_filter = pl.col("state") == state
 
             partition_df = merged.filter(state_filter).collect(engine="streaming")
-            logger.info(
-                f"Partition {partition_key}: {partition_df.height} rows, schema sample:"
+            logger.info(f"Partition {partition_key}: {partition_df.height} rows")
+            # Diagnostics are only computed when DEBUG logging is enabled. The
+            # lambdas bind the frame, not a geometry local that would keep the
+            # column alive past the ``del`` below.
+            logger.opt(lazy=True).debug(
+                "  geometry dtype: {}, null count: {}, sample: {}",
+                lambda df=partition_df: df["geometry"].dtype,
+                lambda df=partition_df: df["geometry"].null_count(),
+                lambda df=partition_df: df["geometry"].head(2),
             )
-            logger.info(f"  geometry dtype: {partition_df['geometry'].dtype}")
-            logger.info(
-                f"  geometry null count: {partition_df['geometry'].null_count()}"
-            )
-            logger.info(f"  geometry sample: {partition_df['geometry'].head(2)}")
 
             if partition_df.is_empty():
                 logger.warning(f"Empty partition for state={partition_key}, skipping")
@@ -190,35 +193,31 @@ async def _write_geoparquet(merged: pl.LazyFrame, output_path: str) -> None:
 
             logger.info(f"Writing partition: state={partition_key}")
 
-            partition_df = merged.filter(state_filter).collect(engine="streaming")
-
-            if partition_df.is_empty():
-                logger.warning(f"Empty partition for state={partition_key}, skipping")
-                continue
-
             Path(partition_path).mkdir(parents=True, exist_ok=True)
 
             arrow_table = partition_df.to_arrow()
             conn.register("partition_table", arrow_table)
 
-            row = conn.execute("SELECT COUNT(*) FROM partition_table").fetchone()
-            count = row[0] if row else 0
-            logger.info(f"DuckDB sees {count} rows in partition_table")
-
             # Write partition — bbox as minx/miny/maxx/maxy struct columns
-            # per GeoParquet spec recommendation
+            # per GeoParquet spec recommendation. WKB is decoded once in the
+            # inner query and reused for all four bbox components.
             sql = f"""
                 COPY (
                     SELECT
-                        * EXCLUDE (geometry, state),
-                        ST_SetCRS(ST_GeomFromWKB(geometry), 'EPSG:4326') AS geometry,
+                        *,
                         struct_pack(
-                            xmin := ST_XMin(ST_GeomFromWKB(geometry)),
-                            ymin := ST_YMin(ST_GeomFromWKB(geometry)),
-                            xmax := ST_XMax(ST_GeomFromWKB(geometry)),
-                            ymax := ST_YMax(ST_GeomFromWKB(geometry))
+                            xmin := ST_XMin(geometry),
+                            ymin := ST_YMin(geometry),
+                            xmax := ST_XMax(geometry),
+                            ymax := ST_YMax(geometry)
                         ) AS bbox
-                    FROM partition_table
+                    FROM (
+                        SELECT
+                            * EXCLUDE (geometry, state),
+                            ST_SetCRS(ST_GeomFromWKB(geometry), 'EPSG:4326')
+                                AS geometry
+                        FROM partition_table
+                    )
                 )
                 TO '{file_path}'
                 WITH (
@@ -241,14 +240,6 @@ async def _write_geoparquet(merged: pl.LazyFrame, output_path: str) -> None:
 
         logger.info(f"GeoParquet dataset written successfully to {output_path}")
 
-    finally:
-        conn.close()
-        import glob
-
-        for f in glob.glob("/tmp/duckdb_*.db"):
-            with contextlib.suppress(Exception):
-                Path(f).unlink()
-
 
 def _fix_geoparquet_metadata(file_path: str, global_bbox: list[float]) -> None:
     """Override the per-file bbox in GeoParquet metadata with the global bbox.
@@ -260,10 +251,6 @@ def _fix_geoparquet_metadata(file_path: str, global_bbox: list[float]) -> None:
         file_path: Path to the written Parquet file.
         global_bbox: Bounding box [xmin, ymin, xmax, ymax] covering all data.
     """
-    import json as _json
-
-    import pyarrow.parquet as pq  # type: ignore[import-untyped]
-
     # Read the full table (preserves row data)
     table = pq.read_table(file_path)
 
@@ -271,7 +258,7 @@ def _fix_geoparquet_metadata(file_path: str, global_bbox: list[float]) -> None:
     decoded = {k.decode(): v.decode() for k, v in existing_meta.items()}
 
     # Parse existing geo metadata written by DuckDB
-    geo = _json.loads(decoded.get("geo", "{}"))
+    geo = json.loads(decoded.get("geo", "{}"))
 
     # Override bbox with global bounds and upgrade version
     geo["version"] = "1.1.0"
@@ -285,11 +272,18 @@ def _fix_geoparquet_metadata(file_path: str, global_bbox: list[float]) -> None:
         }
     }
 
-    decoded["geo"] = _json.dumps(geo)
+    decoded["geo"] = json.dumps(geo)
 
-    # Replace schema metadata and rewrite the full table
+    # Replace schema metadata and rewrite the full table, keeping the row
+    # group sizing used by the DuckDB COPY (pyarrow defaults to ~1M rows)
     updated_table = table.replace_schema_metadata(decoded)
-    pq.write_table(updated_table, file_path, compression="zstd")
+    pq.write_table(
+        updated_table,
+        file_path,
+        compression="zstd",
+        row_group_size=100_000,
+        write_statistics=True,
+    )
 
 
 async def _process_layer(
@@ -307,7 +301,7 @@ async def _process_layer(
     """
     results: dict[str, pl.LazyFrame] = {}
 
-    work = await get_all_geojsons(request.layers)
+    work = await get_all_geojsons(request.layers, tehsils)
 
     while True:
         completed = await poll_completion(work)
@@ -373,4 +367,4 @@ if __name__ == "__main__":
     with open("examples/mws.json") as f:
         request = json.load(f)
     request = LayerConversionRequest(**request)
-    asyncio.run(run_mws_pipeline(request))
+    run_async(run_mws_pipeline(request))
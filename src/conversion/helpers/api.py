@@ -1,17 +1,20 @@
 import asyncio
+import os
+import tempfile
 import warnings
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import fsspec  # type: ignore[import-untyped]
 import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
 import pyogrio  # type: ignore[import-untyped]
-import requests  # type: ignore[import-untyped]
 from loguru import logger
 from tqdm import tqdm  # type: ignore[import-untyped]
 
 from src.utils.configs import settings
+from src.utils.http_client import get_http_session, http_timeout
 
 MWS_URL_MAPPING = {
     "soge": "https://geoserver.core-stack.org:8443/geoserver/soge/ows?service=WFS&version=1.0.0&request=GetFeature&typeName=soge%3Asoge_vector_{district}_{tehsil}&outputFormat=application%2Fjson",
@@ -22,17 +25,29 @@ MWS_URL_MAPPING = {
     "aquifer": "https://geoserver.core-stack.org:8443/geoserver/aquifer/ows?service=WFS&version=1.0.0&request=GetFeature&typeName=aquifer%3Aaquifer_vector_{district}_{tehsil}&outputFormat=application%2Fjson",
 }
 
+GEOJSON_CHUNK_SIZE = 1 << 20  # 1 MiB
+BASE_GEOMETRY_COLUMN = "geom"
+
 
 async def get_active() -> pl.DataFrame:
     """Fetch the list of active locations from the CoreStack API.
 
+    The request runs in a worker thread so it does not block the event loop.
+
     Returns:
         A polars DataFrame containing the active locations JSON response.
+
+    Raises:
+        requests.HTTPError: If the API responds with an error status.
     """
-    response = requests.get(
+    response = await asyncio.to_thread(
+        get_http_session().get,
         f"{settings.corestack_api_url}/get_active_locations/",
         headers={"X-API-KEY": f"{settings.corestack_api_key.get_secret_value()}"},
+        timeout=http_timeout(),
     )
+    # Fail on error statuses before handing an error body to the JSON parser
+    response.raise_for_status()
     _df = pl.read_json(response.content)
     return _df
 
@@ -40,35 +55,75 @@ async def get_active() -> pl.DataFrame:
 async def get_geojson(layer: str, district: str, tehsil: str) -> int:
     """Download a GeoJSON file from GeoServer for a specific tehsil layer.
 
+    Files already present from an earlier run are reused rather than
+    downloaded again. Downloads are written to a uniquely named ``.part``
+    file and renamed into place, so a partially written file is never
+    mistaken for a cached one; the ``.part`` file is removed if writing fails.
+
     Args:
         layer: The name of the layer to fetch.
         district: The district slug name.
         tehsil: The tehsil slug name.
 
     Returns:
-        0 if the download was successful, -1 otherwise.
+        0 if the download was successful or already cached, -1 otherwise.
     """
+    file_path = Path(f"{settings.temp_path}/{layer}_{district}_{tehsil}.geojson")
+    if file_path.is_file() and file_path.stat().st_size > 0:
+        logger.info(f"Using cached geojson {file_path}")
+        return 0
+
     url = MWS_URL_MAPPING[layer].format(district=district, tehsil=tehsil)
     logger.info(
         f"Fetching geojson for layer {layer} "
         f"and district {district} and tehsil {tehsil} "
         f"using url: {url}"
     )
-    response = requests.get(url)
-    if response.status_code == 200:
-        try:
-            with open(
-                f"{settings.temp_path}/{layer}_{district}_{tehsil}.geojson", "w"
+    with get_http_session().get(url, stream=True, timeout=http_timeout()) as response:
+        if response.status_code == 200:
+            # Unique name per download, so concurrent jobs for the same slug
+            # never interleave writes into one partial file
+            with tempfile.NamedTemporaryFile(
+                dir=file_path.parent,
+                prefix=f"{file_path.name}.",
+                suffix=".part",
+                delete=False,
             ) as f:
-                f.write(response.text)
-            return 0
-        except Exception as e:
-            logger.error(
-                f"Failed to write geojson for {layer} {district} {tehsil}: {e}"
-            )
+                part_path = Path(f.name)
+                try:
+                    # Stream raw bytes in fixed-size chunks — avoids holding the
+                    # whole body in memory and decoding it to text just to write it
+                    for chunk in response.iter_content(chunk_size=GEOJSON_CHUNK_SIZE):
+                        f.write(chunk)
+                    f.close()
+                    # mkstemp creates files as 0600; give the cached file the
+                    # umask-based mode a plain open() would, so workers running
+                    # as another uid on the shared cache can still read it
+                    part_path.chmod(_default_file_mode())
+                    part_path.replace(file_path)
+                    return 0
+                except Exception as e:
+                    logger.error(
+                        f"Failed to write geojson for {layer} {district} {tehsil}: {e}"
+                    )
+                finally:
+                    # No-op after a successful rename
+                    part_path.unlink(missing_ok=True)
     return -1
 
 
+def _default_file_mode() -> int:
+    """Return the mode ``open()`` gives new files under the current umask.
+
+    Returns:
+        ``0o666`` with the process umask bits cleared.
+    """
+    # The umask can only be read by setting it; restore it straight away
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 async def convert_base(
     input_path: str, output_path: str, chunk_size: int = 500000
 ) -> bool:
@@ -98,6 +153,9 @@ async def convert_base(
 def _convert_base_sync(input_path: str, output_path: str, chunk_size: int) -> bool:
     """Synchronously process the base layer conversion using pyogrio.
 
+    Features are read as Arrow record batches via GDAL's Arrow stream
+    interface and written to Parquet batch by batch.
+
     Args:
         input_path: Path or URI of the input file.
         output_path: Destination path for the converted Parquet file.
@@ -128,9 +186,34 @@ def _convert_base_sync(input_path: str, output_path: str, chunk_size: int) -> bo
     total_rows = 0
 
     try:
-        reader = pyogrio.read_dataframe(input_path, chunksize=chunk_size)
+        # Stream Arrow record batches straight from GDAL — geometry stays WKB
+        # and no intermediate (Geo)pandas frame is built per chunk.
+        arrow_source = pyogrio.open_arrow(
+            input_path, batch_size=chunk_size, use_pyarrow=True
+        )
+        with (
+            arrow_source as (meta, reader),
+            fsspec.open(output_path, mode="wb") as output_handle,
+        ):
+            # Name geometry "geom" whatever the source format calls it, so the
+            # converted file matches the Parquet base that run_mws_pipeline
+            # renames from (uid/geom)
+            geometry_name = meta["geometry_name"] or "wkb_geometry"
+            column_names = [
+                BASE_GEOMETRY_COLUMN if name == geometry_name else name
+                for name in reader.schema.names
+            ]
+            # Store geometry as plain WKB binary, as polars_st.read_file does —
+            # GDAL's geoarrow.wkb extension metadata makes polars warn on every
+            # scan and would load as an extension type instead of Binary
+            geometry_idx = reader.schema.get_field_index(geometry_name)
+            output_schema = pa.schema(
+                [
+                    field.with_name(name)
+                    for field, name in zip(reader.schema, column_names, strict=True)
+                ]
+            ).set(geometry_idx, pa.field(BASE_GEOMETRY_COLUMN, pa.binary()))
 
-        with fsspec.open(output_path, mode="wb") as output_handle:
             writer = None
             try:
                 with tqdm(
@@ -139,22 +222,21 @@ def _convert_base_sync(input_path: str, output_path: str, chunk_size: int) -> bo
                     desc=f"Converting {Path(input_path).name}",
                     dynamic_ncols=True,
                 ) as pbar:
-                    for i, gdf_chunk in enumerate(reader):
-                        batch = pl.from_pandas(gdf_chunk)
-
-                        if "geometry" not in batch.columns and "geom" in batch.columns:
-                            batch = batch.rename({"geom": "geometry"})
-
-                        table = batch.to_arrow()
+                    for i, record_batch in enumerate(reader):
+                        table = (
+                            pa.Table.from_batches([record_batch])
+                            .rename_columns(column_names)
+                            .cast(output_schema)
+                        )
 
                         if writer is None:
                             writer = pq.ParquetWriter(
-                                output_handle, table.schema, compression="snappy"
+                                output_handle, table.schema, compression="zstd"
                             )
 
                         writer.write_table(table)
-                        total_rows += len(batch)
-                        pbar.update(len(batch))
+                        total_rows += table.num_rows
+                        pbar.update(table.num_rows)
                         pbar.set_postfix(batch=i + 1, rows=total_rows)
 
             finally:
@@ -1,4 +1,7 @@
-import random
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 
 import duckdb
 from duckdb import DuckDBPyConnection
@@ -7,11 +10,42 @@ from loguru import logger
 from src.utils.configs import settings
 
 
-def init_duckdb() -> DuckDBPyConnection:
+@contextmanager
+def duckdb_connection() -> Iterator[DuckDBPyConnection]:
+    """Open an initialized DuckDB connection on a private temporary database.
+
+    Each connection gets a uniquely named database file that is closed and
+    removed on exit, so concurrent workers never share, or delete, each
+    other's databases.
+
+    Yields:
+        An active DuckDB connection object.
+
+    Raises:
+        RuntimeError: If DuckDB initialization fails.
+    """
+    db_path = Path(settings.temp_path) / f"duckdb_{uuid.uuid4().hex}.db"
+    try:
+        conn = init_duckdb(str(db_path))
+        try:
+            yield conn
+        finally:
+            conn.close()
+    finally:
+        # Also runs when initialization fails after the file was created
+        for path in (db_path, db_path.with_name(f"{db_path.name}.wal")):
+            path.unlink(missing_ok=True)
+
+
+def init_duckdb(db_path: str) -> DuckDBPyConnection:
     """Initialize a DuckDB connection with required extensions and settings.
 
-    Sets up a temporary DuckDB database file, loads spatial and S3 extensions,
-    and configures AWS credentials using the default credential chain.
+    Opens the DuckDB database file at ``db_path``, loads spatial and S3
+    extensions, and configures AWS credentials using the default credential
+    chain. Prefer :func:`duckdb_connection`, which also cleans the file up.
+
+    Args:
+        db_path: Path of the database file to open or create.
 
     Returns:
         An active DuckDB connection object.
@@ -20,8 +54,9 @@ def init_duckdb() -> DuckDBPyConnection:
         RuntimeError: If DuckDB initialization fails.
     """
     extensions = ["httpfs", "spatial", "aws"]
+    conn: DuckDBPyConnection | None = None
     try:
-        conn = duckdb.connect(f"/tmp/duckdb_{random.randint(0, 10000)}.db")
+        conn = duckdb.connect(db_path)
         for ext in extensions:
             conn.install_extension(ext)
             conn.load_extension(ext)
@@ -38,4 +73,7 @@ def init_duckdb() -> DuckDBPyConnection:
 
         return conn
     except Exception as e:
+        # Don't leak a half-initialized connection (and its file handle)
+        if conn is not None:
+            conn.close()
         raise RuntimeError(f"Failed to initialize DuckDB: {e}") from e
@@ -1,7 +1,7 @@
 import polars as pl
 from loguru import logger
 
-from src.conversion.helpers.duckdb_funcs import init_duckdb
+from src.conversion.helpers.duckdb_funcs import duckdb_connection
 
 BATCH_SIZE = 25_000
 
@@ -41,8 +41,7 @@ def fill_missing_admin_boundaries(
         logger.info("No missing admin boundaries — skipping spatial join")
         return merged
 
-    conn = init_duckdb()
-    try:
+    with duckdb_connection() as conn:
         # Load tehsil boundaries once into a persistent DuckDB table
         conn.execute(f"""
             CREATE TABLE tehsils AS
@@ -101,8 +100,9 @@ def fill_missing_admin_boundaries(
                 pl.col("tehsil").str.to_titlecase(),
             )
 
-            matched = batch_lookup.filter(pl.col("state").is_not_null()).height
-            unmatched = batch_lookup.filter(pl.col("state").is_null()).height
+            # Null count comes from the column's validity metadata — no filtered copies
+            unmatched = batch_lookup["state"].null_count()
+            matched = batch_lookup.height - unmatched
             total_matched += matched
             total_unmatched += unmatched
             logger.info(f"  Batch result: {matched} matched, {unmatched} unmatched")
@@ -125,8 +125,6 @@ def fill_missing_admin_boundaries(
         logger.info(
             f"Admin boundary fill: {total_matched} matched, {total_unmatched} unmatched"
         )
-    finally:
-        conn.close()
 
     logger.info("Admin boundary fill complete")
 
@@ -1,4 +1,6 @@
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import polars as pl
 import polars_st as st
@@ -21,6 +23,9 @@ def merge_tehsils_on_layer(
 ) -> pl.LazyFrame:
     """Merge all tehsil-level GeoJSONs for a specific layer.
 
+    Files are read concurrently on a thread pool; GDAL releases the GIL while
+    parsing, so reads overlap instead of running one tehsil at a time.
+
     Args:
         layer: Name of the layer being processed.
         tehsils: Dataframe containing active tehsil metadata (name, district, state).
@@ -33,46 +38,15 @@ def merge_tehsils_on_layer(
     Raises:
         ValueError: If no valid GeoJSON files were found for the layer.
     """
-    tehsil_data = tehsils.collect(engine="streaming")
-    frames: list[pl.LazyFrame] = []
-
-    for row in tqdm(tehsil_data.to_dicts()):
-        tehsil_name = clean_label(row.get("tehsil_name", ""))
-        district_name = clean_label(row.get("district_name", ""))
-
-        file_path = f"{settings.temp_path}{layer}_{district_name}_{tehsil_name}.geojson"
-
-        try:
-            df = st.read_file(file_path)
-            df: pl.DataFrame = rename_and_drop(
-                df.lazy(), cols_rename, drop_cols
-            ).collect(engine="streaming")
-            if "geometry" not in df.columns and "geom" in df.columns:
-                df = pl.DataFrame(df.rename({"geom": "geometry"}))
-            if df.is_empty():
-                continue
-            exprs = []
-            for col_target, col_source in [
-                ("version", "algorithm version"),
-                ("tehsil", "tehsil_name"),
-                ("district", "district_name"),
-                ("state", "state_name"),
-            ]:
-                val = row.get(col_source)
-                if col_target == "version":
-                    val_expr = pl.lit(val).cast(pl.Float64, strict=False)
-                else:
-                    val_expr = pl.lit(val)
-
-                exprs.append(val_expr.alias(col_target))
-
-            if exprs:
-                df = pl.DataFrame(df.with_columns(exprs))
-
-            frames.append(df.lazy())
-        except DataSourceError:
-            logger.error(f"File not found: {file_path}")
-            continue
+    rows = tehsils.collect(engine="streaming").to_dicts()
+    read_one = partial(
+        _read_tehsil_file, layer, cols_rename=cols_rename, drop_cols=drop_cols
+    )
+
+    with ThreadPoolExecutor(max_workers=settings.merge_read_workers) as pool:
+        results = list(tqdm(pool.map(read_one, rows), total=len(rows)))
+
+    frames = [frame for frame in results if frame is not None]
 
     if not frames:
         raise ValueError(f"No files found for layer: {layer}")
@@ -82,6 +56,62 @@ def merge_tehsils_on_layer(
     return merged.lazy()
 
 
+def _read_tehsil_file(
+    layer: str,
+    row: dict,
+    cols_rename: dict[str, str],
+    drop_cols: list[str],
+) -> pl.LazyFrame | None:
+    """Read one tehsil GeoJSON for a layer and tag it with location metadata.
+
+    Args:
+        layer: Name of the layer being processed.
+        row: Tehsil metadata row (tehsil, district, state names and version).
+        cols_rename: Dictionary mapping original column names to target names.
+        drop_cols: List of columns to drop from the GeoJSON.
+
+    Returns:
+        The tagged LazyFrame, or None if the file is missing or empty.
+    """
+    tehsil_name = clean_label(row.get("tehsil_name", ""))
+    district_name = clean_label(row.get("district_name", ""))
+
+    file_path = f"{settings.temp_path}{layer}_{district_name}_{tehsil_name}.geojson"
+
+    try:
+        # Layer geometries are dropped before the join (the base layer is
+        # authoritative), so skip decoding them entirely
+        df = st.read_file(file_path, read_geometry=False)
+    except DataSourceError:
+        logger.error(f"File not found: {file_path}")
+        return None
+
+    df: pl.DataFrame = rename_and_drop(df.lazy(), cols_rename, drop_cols).collect(
+        engine="streaming"
+    )
+    if df.is_empty():
+        return None
+    exprs = []
+    for col_target, col_source in [
+        ("version", "algorithm version"),
+        ("tehsil", "tehsil_name"),
+        ("district", "district_name"),
+        ("state", "state_name"),
+    ]:
+        val = row.get(col_source)
+        if col_target == "version":
+            val_expr = pl.lit(val).cast(pl.Float64, strict=False)
+        else:
+            val_expr = pl.lit(val)
+
+        exprs.append(val_expr.alias(col_target))
+
+    if exprs:
+        df = pl.DataFrame(df.with_columns(exprs))
+
+    return df.lazy()
+
+
 def merge_all_layers(
     layer_results: dict[str, pl.LazyFrame],
     base: pl.LazyFrame,
@@ -190,18 +220,18 @@ def _extract_location_meta(
             c in schema for c in ["mws_id", "version", "tehsil", "district", "state"]
         ):
             logger.info(f"Using '{layer_name}' as location metadata source")
-            meta = layer_df.select(
-                ["mws_id", "version", "tehsil", "district", "state"]
-            ).unique(subset=["mws_id", "version"])
-
-            # Warn if there are duplicate mws_id+version after dedup
-            # (shouldn't happen but indicates upstream data issues)
-            count = meta.collect(engine="streaming").height
+            # Materialize once — the lookup is small (5 columns) and would
+            # otherwise be recomputed by the join after counting it here
+            meta = (
+                layer_df.select(["mws_id", "version", "tehsil", "district", "state"])
+                .unique(subset=["mws_id", "version"])
+                .collect(engine="streaming")
+            )
             logger.info(
-                f"Location metadata: {count} unique mws_id+version pairs "
+                f"Location metadata: {meta.height} unique mws_id+version pairs "
                 f"from '{layer_name}'"
             )
-            return meta
+            return meta.lazy()
 
     raise ValueError(
         "No layer contains all of: mws_id, version, tehsil, district, state. "
@@ -212,7 +242,7 @@ def _extract_location_meta(
 def _get_missing_mws_ids(
     base: pl.LazyFrame,
     layer_results: dict[str, pl.LazyFrame],
-) -> pl.LazyFrame:
+) -> pl.DataFrame:
     """Identify MWSv2 polygon IDs that do not appear in any layer.
 
     These are typically polygons outside the active tehsil list.
@@ -222,7 +252,7 @@ def _get_missing_mws_ids(
         layer_results: Dictionary mapping layer names to their LazyFrames.
 
     Returns:
-        A LazyFrame containing the missing mws_id and version pairs.
+        A DataFrame containing the missing mws_id and version pairs.
     """
     all_layer_ids = pl.concat(
         [
@@ -235,11 +265,12 @@ def _get_missing_mws_ids(
 
     base_ids = base.select(["mws_id", "version"])
 
-    missing = base_ids.join(all_layer_ids, on=["mws_id", "version"], how="anti")
+    missing = base_ids.join(
+        all_layer_ids, on=["mws_id", "version"], how="anti"
+    ).collect(engine="streaming")
 
-    missing_count = missing.collect(engine="streaming").height
     logger.info(
-        f"Found {missing_count} MWSv2 polygons not present in any active tehsil layer"
+        f"Found {missing.height} MWSv2 polygons not present in any active tehsil layer"
     )
 
     return missing
@@ -1,45 +1,65 @@
 import polars as pl
 from loguru import logger
-from rq.job import Job
+from rq.job import Job, JobStatus
 
-from src.conversion.helpers.api import get_active, get_geojson
-from src.conversion.helpers.cleaners import clean_label, clean_tehsils
-from src.work.work_queue import get_status, mq
+from src.conversion.helpers.api import get_geojson
+from src.conversion.helpers.cleaners import clean_label
+from src.utils.http_client import download_job_timeout
+from src.work.work_queue import mq
 
 
-async def _create_tehsil_map(layer: str, tehsils_t: pl.DataFrame) -> dict[str, str]:
+async def _create_tehsil_map(
+    layer: str, tehsil_slugs: list[tuple[str, str]]
+) -> dict[str, str]:
     """Enqueue GeoJSON download tasks for a layer across all active tehsils.
 
     Args:
         layer: The name of the layer.
-        tehsils_t: DataFrame containing tehsil information.
+        tehsil_slugs: Cleaned (district, tehsil) label pairs.
 
     Returns:
         A dictionary mapping task IDs to rq Job objects.
     """
     tmap: dict = {}
+    job_timeout = download_job_timeout()
 
-    for row in tehsils_t.iter_rows():
-        task = mq.enqueue(get_geojson, layer, clean_label(row[2]), clean_label(row[4]))
-        tmap[f"{layer}_{clean_label(row[2])}_{clean_label(row[4])}"] = task
+    for district, tehsil in tehsil_slugs:
+        task = mq.enqueue(get_geojson, layer, district, tehsil, job_timeout=job_timeout)
+        tmap[f"{layer}_{district}_{tehsil}"] = task
 
     return tmap
 
 
-async def get_all_geojsons(layers: list[str]) -> dict:
+async def get_all_geojsons(layers: list[str], tehsils: pl.LazyFrame) -> dict:
     """Queue GeoJSON downloads for multiple layers.
 
     Args:
         layers: List of layer names to download.
+        tehsils: Active tehsils already fetched by the caller, so the
+            active-locations API is not queried a second time.
 
     Returns:
         A dictionary mapping layer names to their corresponding tehsil task maps.
     """
-    tehsils_t = clean_tehsils(await get_active()).collect(engine="streaming")
+    # The version metadata join can repeat a tehsil; each download must be
+    # queued once, or a second job writes the same file untracked
+    tehsils_t = (
+        tehsils.select("district_name", "tehsil_name")
+        .unique(maintain_order=True)
+        .collect(engine="streaming")
+    )
+    # Slugs only depend on the tehsil, so resolve them once for every layer.
+    # dict.fromkeys also drops distinct names that clean to the same slug.
+    tehsil_slugs = list(
+        dict.fromkeys(
+            (clean_label(district), clean_label(tehsil))
+            for district, tehsil in tehsils_t.iter_rows()
+        )
+    )
     all_geojsons: dict = {}
 
     for layer in layers:
-        tmap = await _create_tehsil_map(layer, tehsils_t)
+        tmap = await _create_tehsil_map(layer, tehsil_slugs)
         logger.info(f"Created tehsil map for layer {layer}")
         all_geojsons[layer] = tmap
 
@@ -49,6 +69,9 @@ async def get_all_geojsons(layers: list[str]) -> dict:
 async def _get_task_completion(layer: dict[str, Job]) -> tuple[int, int, int, int]:
     """Get the completion status counts for a layer's download tasks.
 
+    All jobs are fetched in a single pipelined Redis round trip rather than
+    one status lookup per job.
+
     Args:
         layer: Dictionary of task IDs to Job objects.
 
@@ -60,15 +83,18 @@ async def _get_task_completion(layer: dict[str, Job]) -> tuple[int, int, int, in
     in_progress = 0
     pending = 0
 
-    for i in layer.values():
-        status = await get_status(i.id)
-        if status["status"] == "finished":
+    jobs = Job.fetch_many([job.id for job in layer.values()], connection=mq.connection)
+    for job in jobs:
+        if job is None:
+            continue
+        status = job.get_status(refresh=False)
+        if status == JobStatus.FINISHED:
             completed += 1
-        elif status["status"] == "failed":
+        elif status == JobStatus.FAILED:
             failed += 1
-        elif status["status"] == "started":
+        elif status == JobStatus.STARTED:
             in_progress += 1
-        elif status["status"] == "queued":
+        elif status == JobStatus.QUEUED:
             pending += 1
 
     return (completed, failed, in_progress, pending)
@@ -4,12 +4,16 @@ from rq.job import Job
 from src.app.models import BaseLayers, LayerConversionRequest
 from src.conversion.algos import run_mws_pipeline
 from src.conversion.helpers.api import convert_base
+from src.utils.configs import settings
+from src.utils.event_loop import run_async
 from src.work.work_queue import bq, lq
 
 
 def handle_layers(request: LayerConversionRequest) -> dict:
     logger.info(f"Enqueueing layer conversion job for unit={request.unit}")
-    tid = lq.enqueue(layer_conversion, request)
+    # The pipeline polls its download jobs and writes every partition before
+    # returning, far beyond rq's 180s default
+    tid = lq.enqueue(layer_conversion, request, job_timeout=settings.layer_job_timeout)
     return {
         "task_id": tid.id,
         "status": tid.get_status().name,
@@ -21,8 +25,8 @@ def layer_conversion(request: LayerConversionRequest) -> None:
         f"Starting layer conversion: unit={request.unit}, layers={list(request.layers)}"
     )
     try:
-        output = run_mws_pipeline(request)
-        logger.info(f"Layer conversion complete -> {output}")
+        run_async(run_mws_pipeline(request))
+        logger.info(f"Layer conversion complete -> {request.output_path}")
     except Exception as e:
         logger.error(f"Layer conversion failed: {e}")
         raise
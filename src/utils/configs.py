@@ -29,9 +29,21 @@ class Settings(BaseSettings):
     corestack_api_key: SecretStr = SecretStr("")
     base_geoserver: str = ""
 
+    # Outbound HTTP (seconds)
+    http_connect_timeout: float = 10.0
+    http_read_timeout: float = 60.0
+    http_retries: int = 3
+    http_transfer_allowance: int = 600
+
+    # RQ job timeouts (seconds)
+    layer_job_timeout: int = 6 * 60 * 60
+
     # Working Directory
     temp_path: str = "/tmp/"
 
+    # Concurrent tehsil GeoJSON reads when merging a layer
+    merge_read_workers: int = 8
+
     # Raw Admin Bounds Files
     tehsil_bounds: str = ""
 
@@ -0,0 +1,32 @@
+"""Event loop helpers.
+
+Synchronous entry points run coroutines through :func:`run_async` so they
+use ``uvloop`` when it is installed (it ships with ``uvicorn[standard]``)
+and fall back to the stock asyncio loop otherwise.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop  # type: ignore[import-not-found]
+
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return asyncio.run(coro, loop_factory=_loop_factory)
@@ -0,0 +1,92 @@
+"""Shared HTTP session factory.
+
+A single :func:`get_http_session` call is the canonical way to make outbound
+HTTP requests (CoREStack API, GeoServer) anywhere in the project, so every
+request gets the same retry policy, and :func:`http_timeout` the same
+timeouts.  rq forks a fresh work-horse per job and each job makes a single
+request, so connections are not reused across jobs.
+"""
+
+import math
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+
+from src.utils.configs import settings
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF_FACTOR = 1
+# Cap on a server's Retry-After (429/503); urllib3 would otherwise sleep up
+# to 6 hours, far past the download job timeout
+RETRY_AFTER_MAX = 60
+
+_session: requests.Session | None = None
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide HTTP session, creating it on first call.
+
+    The session is lazily initialised and cached for the lifetime of the
+    process.
+
+    Connection errors and throttling/server errors (429, 5xx) on GET
+    requests are retried up to ``http_retries`` times with exponential
+    backoff, so a transient GeoServer hiccup does not drop a tehsil file.
+
+    Returns:
+        A :class:`requests.Session` instance.
+    """
+    global _session
+    if _session is None:
+        retries = Retry(
+            total=settings.http_retries,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=["GET"],
+            raise_on_status=False,
+            retry_after_max=RETRY_AFTER_MAX,
+        )
+        adapter = HTTPAdapter(max_retries=retries)
+        _session = requests.Session()
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def http_timeout() -> tuple[float, float]:
+    """Return the ``(connect, read)`` timeout to pass on every request.
+
+    ``requests`` has no session-wide timeout, and without one a stalled
+    server holds a worker forever.  The read timeout bounds the wait between
+    bytes, not the whole download, and must stay well below the rq job
+    timeout of the download jobs so a stall fails the request first.
+
+    Returns:
+        The configured connect and read timeouts in seconds.
+    """
+    return settings.http_connect_timeout, settings.http_read_timeout
+
+
+def download_job_timeout() -> int:
+    """Return the rq ``job_timeout`` for a job making one retried download.
+
+    Budgets the worst case of every attempt hitting both timeouts, plus the
+    exponential backoff or a capped ``Retry-After`` wait between attempts,
+    then adds
+    ``http_transfer_allowance`` for streaming the body, which the read
+    timeout does not bound.  Keeps rq from killing a job while requests is
+    still waiting to time out or retry.
+
+    Returns:
+        The job timeout in seconds.
+    """
+    attempts = settings.http_retries + 1
+    per_attempt = settings.http_connect_timeout + settings.http_read_timeout
+    # Each wait is either the backoff or Retry-After; budget for both
+    backoff = RETRY_BACKOFF_FACTOR * (2**settings.http_retries - 1)
+    retry_after = settings.http_retries * RETRY_AFTER_MAX
+    return (
+        math.ceil(attempts * per_attempt + backoff + retry_after)
+        + settings.http_transfer_allowance
+    )
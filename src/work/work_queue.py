@@ -1,6 +1,8 @@
 from loguru import logger
 from redis.exceptions import ConnectionError as RedisConnectionError
 from rq import Queue
+from rq.exceptions import NoSuchJobError
+from rq.job import Job
 
 from src.utils.redis_client import get_redis_client
 
@@ -28,13 +30,19 @@ lq, iq, bq, mq = _make_queues()
 
 
 async def get_status(task_id: str) -> dict[str, str]:
-    task = lq.fetch_job(task_id)
-    if not task:
-        task = iq.fetch_job(task_id)
-    if not task:
-        task = bq.fetch_job(task_id)
-    if not task:
-        task = mq.fetch_job(task_id)
-    if not task:
+    """Look up the status of a job on any queue.
+
+    Jobs are stored by ID independently of the queue they were enqueued on,
+    so a single fetch replaces probing each queue in turn.
+
+    Args:
+        task_id: The RQ job ID.
+
+    Returns:
+        A dictionary with the job status, or "not found" if it does not exist.
+    """
+    try:
+        task = Job.fetch(task_id, connection=get_redis_client())
+    except NoSuchJobError:
         return {"status": "not found"}
     return {"status": task.get_status().value}
@@ -1,8 +1,15 @@
+import sys
+
 from rq import Worker
 
 from src.utils.redis_client import get_redis_client
 
-w = Worker(["layers", "id", "base", "meta"], connection=get_redis_client())
+QUEUES = ["layers", "id", "base", "meta"]
+
+# Queue names may be passed on the command line (e.g. ``workers.py meta``) so
+# the tehsil downloads on "meta" can get workers of their own: a layer job
+# blocks its worker until every download it queued has finished.
+w = Worker(sys.argv[1:] or QUEUES, connection=get_redis_client())
 
 if __name__ == "__main__":
     w.work()